@@ -0,0 +1,254 @@
+# ------------------------------
+# 🌤️ WEATHER IMAGE CLASSIFIER (Kaggle notebook)
+# Run on its own: python weather_classifier.py
+# Kept out of app.py so the dashboard never imports TensorFlow, OpenCV,
+# seaborn or scikit-learn on a page render.
+# ------------------------------
+
+import kagglehub
+import os
+import sys
+
+path = kagglehub.dataset_download("vijaygiitk/multiclass-weather-dataset")
+
+print('Data source import complete.')
+print("Path to dataset files:", path)
+
+
+# This Python 3 environment comes with many helpful analytics libraries installed
+# It is defined by the kaggle/python Docker image: https://github.com/kaggle/docker-python
+# For example, here's several helpful packages to load
+
+import numpy as np # linear algebra
+import pandas as pd # data processing, CSV file I/O (e.g. pd.read_csv)
+import matplotlib.pyplot as plt
+import random
+import cv2
+import tqdm as tqdm
+from tensorflow.keras.preprocessing.image import load_img
+from tensorflow.keras.preprocessing.image import ImageDataGenerator
+
+# Input data files are available in the read-only "../input/" directory
+# For example, running this (by clicking run or pressing Shift+Enter) will list all files under the input directory
+
+# One write for the whole listing instead of a print() per image file
+input_files = [
+    os.path.join(dirname, filename)
+    for dirname, _, filenames in os.walk('/kaggle/input')
+    for filename in filenames
+]
+if input_files:
+    sys.stdout.write("\n".join(input_files) + "\n")
+
+
+root_dir = "/kaggle/input/multiclass-weather-dataset"
+os.listdir(root_dir)
+os.path.exists(root_dir)
+
+# Cell A: Create a 1-year (2025) seasonally realistic weather dataset
+
+# Plausible temperature range per month (Celsius), indexed by month number
+# (1 = Jan ... 12 = Dec; index 0 unused)
+# Simple hemispheric model (adjust to your location if needed)
+# Jan (1) -> winter-like, Jul (7) -> summer-like (this is generic)
+SEASON_TEMP_LOW = np.array([15, 8, 8, 15, 15, 15, 25, 25, 25, 18, 18, 18, 8])
+SEASON_TEMP_HIGH = np.array([30, 20, 20, 26, 26, 26, 40, 40, 40, 30, 30, 30, 20])
+
+conditions = ["Sunny", "Cloudy", "Rainy", "Stormy", "Windy", "Foggy"]
+condition_weights = np.array([40, 25, 20, 5, 6, 4])  # bias toward Sunny/Cloudy in generic locales
+# humidity tends to be higher when rainy/stormy/foggy
+HUMIDITY_LOW = np.array([35, 35, 70, 75, 35, 80])
+HUMIDITY_HIGH = np.array([80, 80, 95, 98, 80, 95])
+
+# Whole-year arrays instead of one Python loop iteration per day
+rng = np.random.default_rng()
+dates = pd.date_range("2025-01-01", periods=365, freq="D")
+months = dates.month.to_numpy()
+n_days = len(dates)
+
+# integers() excludes the upper bound, so +1 keeps the ranges inclusive
+temps = rng.integers(SEASON_TEMP_LOW[months], SEASON_TEMP_HIGH[months] + 1)
+# add some daily noise
+temps = (temps + rng.normal(0, 2, n_days)).astype(int)
+cond_idx = rng.choice(len(conditions), size=n_days, p=condition_weights / condition_weights.sum())
+humidity = rng.integers(HUMIDITY_LOW[cond_idx], HUMIDITY_HIGH[cond_idx] + 1)
+wind = rng.integers(3, 31, n_days)
+
+df_year = pd.DataFrame({
+    "Date": dates.strftime("%m-%d-%Y"),
+    "Temperature": temps,
+    "Condition": np.array(conditions)[cond_idx],
+    "Humidity": humidity,
+    "WindSpeed": wind
+})
+df_year.to_csv("weather_data.csv", index=False)
+print("✅ Created 'weather_data.csv' with", len(df_year), "rows (2025).")
+df_year.head()
+
+foggy = "/kaggle/input/multiclass-weather-dataset/dataset/foggy"
+sunrise = "/kaggle/input/multiclass-weather-dataset/dataset/sunrise"
+shine = "/kaggle/input/multiclass-weather-dataset/dataset/shine"
+rainy = "/kaggle/input/multiclass-weather-dataset/dataset/rainy"
+cloudy = "/kaggle/input/multiclass-weather-dataset/dataset/cloudy"
+test = "/kaggle/input/multiclass-weather-dataset/dataset/alien_test"
+
+print("Number of Images in Each Directory:")
+print(f"Foggy: {len(os.listdir(foggy))}")
+print(f"Sunrise: {len(os.listdir(sunrise))}")
+print(f"Shine: {len(os.listdir(shine))}")
+print(f"Rainy: {len(os.listdir(rainy))}")
+print(f"Cloudy: {len(os.listdir(cloudy))}")
+
+x = []
+y = []
+dataset =[]
+def create_dataset(directory,dir_name):
+    for i in tqdm.tqdm(os.listdir(directory)):
+        full_path = os.path.join(directory,i)
+        try:
+            img = cv2.imread(full_path)
+            img = cv2.resize(img,(150,150))
+        except:
+            continue
+        x.append(img)
+        y.append(dir_name)
+    return x,y
+
+x,y= create_dataset(foggy,"foggy")
+x,y= create_dataset(sunrise,"sunrise")
+x,y= create_dataset(shine,"shine")
+x,y= create_dataset(rainy,"rainy")
+x,y= create_dataset(cloudy,"cloudy")
+
+x =  np.array(x)
+y = np.array(y)
+x.shape,y.shape
+
+import seaborn as sns
+plt.figure(figsize=(9,7))
+plt.style.use("fivethirtyeight")
+sns.countplot(y)
+plt.show()
+
+fig = plt.figure(figsize=(12,7))
+for i in range(15):
+    sample =  random.choice(range(len(x)))
+    image = x[sample]
+    category = y[sample]
+    plt.subplot(3,5,i+1)
+    plt.subplots_adjust(hspace=0.3)
+    plt.imshow(image)
+    plt.xlabel(category)
+
+plt.tight_layout()
+plt.show()
+
+from sklearn.preprocessing import LabelEncoder
+le = LabelEncoder()
+y = le.fit_transform(y)
+
+from sklearn.model_selection import train_test_split
+x_train,x_test,y_train,y_test = train_test_split(x,y,test_size=0.2,random_state=42)
+
+img_size =150
+
+x_train = np.array(x_train)/255.0
+x_test = np.array(x_test)/255.0
+
+
+x_train = x_train.reshape(-1,img_size,img_size,3)
+y_train = np.array(y_train)
+
+x_test = x_test.reshape(-1,img_size,img_size,3)
+y_test = np.array(y_test)
+
+from sklearn.preprocessing import LabelBinarizer
+lb = LabelBinarizer()
+y_train_lb = lb.fit_transform(y_train)
+y_test_lb = lb.fit_transform(y_test)
+
+y_train_lb.shape,y_test_lb.shape
+
+from tensorflow.keras.applications.vgg19 import VGG19
+vgg = VGG19(weights = "imagenet",include_top=False,input_shape=(img_size,img_size,3))
+
+for layer in vgg.layers:
+    layer.trainable = False
+
+from tensorflow.keras import Sequential
+from tensorflow.keras.layers import Flatten,Dense
+model =Sequential()
+model.add(vgg)
+model.add(Flatten())
+model.add(Dense(5,activation="softmax"))
+model.summary()
+
+from tensorflow.keras.callbacks import ModelCheckpoint, EarlyStopping
+
+checkpoint = ModelCheckpoint("vgg19.h5",
+                             monitor="val_accuracy",
+                             verbose=1,
+                             save_best_only=True,
+                             save_weights_only=False)
+
+earlystop = EarlyStopping(monitor="val_accuracy",
+                          patience=5,
+                          verbose=1)
+
+unique,counts = np.unique(y_train_lb,return_counts=True)
+print(unique,counts)
+
+model.compile(optimizer="adam",
+              loss="categorical_crossentropy",
+              metrics=["accuracy"])
+batch_size = 32
+history = model.fit(x_train, y_train_lb,
+                    epochs=15,
+                    validation_data=(x_test, y_test_lb),
+                    batch_size=batch_size,
+                    verbose=1,
+                    callbacks=[checkpoint, earlystop])
+
+loss,accuracy = model.evaluate(x_test,y_test_lb)
+print(f"Loss: {loss}")
+print(f"Accuracy: {accuracy}")
+y_pred = model.predict_classes(x_test)
+y_pred[:15]
+from sklearn.metrics import classification_report
+print(classification_report(y_test,y_pred))
+from sklearn.metrics import confusion_matrix
+from mlxtend.plotting import plot_confusion_matrix
+cm = confusion_matrix(y_test,y_pred)
+plot_confusion_matrix(conf_mat = cm,figsize=(8,7),class_names = ["cloudy","foggy","rainy","shine","sunrise"],
+                      show_normed = True);
+
+plt.style.use("ggplot")
+fig = plt.figure(figsize=(12,6))
+epochs = range(1,16)
+plt.subplot(1,2,1)
+plt.plot(epochs,history.history["accuracy"],"go-")
+plt.plot(epochs,history.history["val_accuracy"],"ro-")
+plt.title("Model Accuracy")
+plt.xlabel("Epochs")
+plt.ylabel("Accuracy")
+plt.legend(["Train","val"],loc = "upper left")
+
+plt.subplot(1,2,2)
+plt.plot(epochs,history.history["loss"],"go-")
+plt.plot(epochs,history.history["val_loss"],"ro-")
+plt.title("Model Loss")
+plt.xlabel("Epochs")
+plt.ylabel("Loss")
+plt.legend(["Train","val"],loc = "upper left")
+plt.show()
+plt.figure(figsize=(12,9))
+plt.style.use("ggplot")
+for i in range(10):
+    sample = random.choice(range(len(x_test)))
+    plt.subplot(2,5,i+1)
+    plt.subplots_adjust(hspace=0.3)
+    plt.imshow(x_test[sample])
+    plt.xlabel(f"Actual: {y_test[sample]}\n Predicted: {y_pred[sample]}")
+
+plt.tight_layout()
+plt.show()